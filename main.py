@@ -1,6 +1,248 @@
-import os, re, json, string, requests
-from collections import defaultdict
-from typing import Dict, DefaultDict
+import mmap
+import os, re, string, sys, requests
+import orjson
+from collections import Counter
+from functools import lru_cache
+from multiprocessing import Pool
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# Patterns compiled once at import time; these run once per token (~1M calls),
+# so avoiding the re-cache lookup on every call matters.
+_RE_POSS = re.compile(r"'s$")
+_RE_NUMHYPH = re.compile(r'^\d+(?:-\d+)+$')
+_RE_FRAC = re.compile(r'^\d+/\d+$')
+# One pass over the raw bytes: each match is a 'word/tag' token, with the
+# greedy first group leaving only the text after the last slash as the tag.
+# A bytes pattern lets the engine scan an mmap'd file without decoding it.
+_RE_TOKEN_BYTES = re.compile(rb'(\S+)/(\S+?)(?=\s|$)')
+_RE_TWO_WORDS = re.compile(r'[a-z]+/[a-z]+')
+
+# Headline/title/citation markers appended to tags (e.g. 'nn-hl', 'np-tl');
+# the lookahead leaves the dash between stacked markers in place so
+# 'nn-tl-hl' reduces to 'nn' rather than gluing into a junk tag.
+_RE_HLTLNC = re.compile(r'-(?:hl|tl|nc)(?=-|$)')
+# Modifier form of a tag: an optional foreign/citation prefix followed by the
+# head tag, which runs up to the first '+' or '-'. One engine entry handles
+# the prefix strip and both truncations.
+_RE_CLEAN_POS = re.compile(r'(?:(?:fw|nc|np)-)?([^+\-]+)')
+
+# Same sorted, 2-space-indented layout the stdlib json.dump calls produced,
+# but serialized in C by orjson.
+_ORJSON_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+
+
+@lru_cache(maxsize=200_000)
+def clean_pos_tag(tag: str) -> Optional[str]:
+    """
+    Normalizes and cleans a raw POS tag string.
+
+    This handles various tag modifiers found in the corpus:
+    1. Simplifies compound tags (e.g., removing parts after '+').
+    2. Removes prefixes for foreign words ('fw-') or cited words ('nc-', 'np-').
+    3. Strips suffixes related to headlines or titles ('-hl', '-tl').
+    4. Returns 'nil' if the tag is empty or invalid.
+
+    Results are memoized and interned: token frequencies are
+    Zipf-distributed, so a few thousand distinct tags cover almost every
+    call, and interned tags make the downstream dict lookups an identity
+    compare.
+    """
+    if not tag or tag == 'nil':
+        return 'nil'
+    if '*' in tag:
+        return None
+    # Fast path: the vast majority of tags carry no modifier at all.
+    if '-' not in tag and '+' not in tag:
+        return sys.intern(tag)
+    # Drop suffix markers before the prefix match so 'np-tl' reads as
+    # np + title marker, not as an np- prefix.
+    tag = _RE_HLTLNC.sub('', tag)
+    m = _RE_CLEAN_POS.match(tag)
+    return sys.intern(m.group(1)) if m else 'nil'
+
+
+@lru_cache(maxsize=200_000)
+def clean_word(word: str) -> Optional[str]:
+    """
+    Sanitizes and normalizes a word string.
+
+    This function performs several cleaning steps:
+    - Strips surrounding quotes and spaces.
+    - Removes possessive endings ("'s").
+    - Filters out tokens that consist solely of punctuation.
+    - Preserves valid hyphenated words (e.g., "1940-50") and fractions.
+    Returns None if the word should be discarded.
+
+    Results are memoized and interned: a small set of high-frequency words
+    covers the bulk of the corpus occurrences, and interned words share
+    storage across the counting structures.
+    """
+    # Fast path: most corpus tokens are plain alphabetic words, which every
+    # cleaning step below would pass through unchanged.
+    if word and word.isalpha():
+        return sys.intern(word)
+
+    word = word.strip('\'" ')
+
+    word = _RE_POSS.sub("", word)
+
+    if word and all(char in string.punctuation for char in word):
+        return None
+
+    if '-' in word:
+        # Keep e.g., 1-2, 1940-50
+        if _RE_NUMHYPH.match(word):
+            return sys.intern(word)
+        if not word.endswith('-'):
+            return sys.intern(word)
+    # Keep e.g., 1/2, 3/4
+    if _RE_FRAC.match(word):
+        return sys.intern(word)
+
+    return sys.intern(word) if word else None
+
+
+def process_compound_word(word: str, pos: str,
+                          pairs: List[Tuple[str, str]]) -> bool:
+    """
+    Handles complex word tokens that contain forward slashes.
+
+    If a token contains a slash but is not a simple fraction or date (e.g., 'word1/word2'),
+    this function splits it into component parts and appends each part to
+    the given pair accumulator. Returns True if the word was processed as
+    a compound.
+    """
+    if '/' not in word:
+        return False
+    if _RE_FRAC.match(word):
+        return False
+    for part in word.split('/'):
+        cleaned_word = clean_word(part)
+        if cleaned_word and pos is not None:
+            pairs.append((cleaned_word, pos))
+    return True
+
+
+def _is_corpus_filename(name: str) -> bool:
+    r"""
+    Matches Brown corpus filenames like 'ca01': 'c', a lowercase section
+    letter, and a two-digit number. Four character comparisons replace the
+    old ^c[a-z]\d{2}$ regex.
+    """
+    return (len(name) == 4 and name[0] == 'c'
+            and 'a' <= name[1] <= 'z' and name[2:].isdigit())
+
+
+def _count_content(content: bytes, tag_to_group: Dict[str, str]) -> Tuple[Counter, Counter, Counter]:
+    """
+    Counts every token in the raw content of a file.
+
+    The content is any bytes-like buffer (typically the file's mmap), so
+    the regex engine scans it without a full decoded copy; only the short
+    matched groups are decoded.
+
+    Coordinated pairs sharing one tag (e.g. 'and/or/cc' arrives as word
+    'and/or' with tag 'cc') are handled inline. Returns the file's pair,
+    tag, and group Counters instead of touching shared state, so it can
+    run in a worker process.
+    """
+    # Bind everything the per-token loop touches to local names: LOAD_FAST
+    # is markedly cheaper than LOAD_ATTR + method dispatch over ~1M tokens.
+    # Counts are accumulated in plain lists and folded into the Counters
+    # in one C-level update per file instead of a dict update per token.
+    pairs: List[Tuple[str, str]] = []
+    groups: List[str] = []
+    pairs_append = pairs.append
+    groups_append = groups.append
+    # Direct dict.get instead of the get_pos_group method: no 'nil' key
+    # exists in the mapping, so the default covers that case too.
+    tag_to_group_get = tag_to_group.get
+    # Tokenization is case-blind, so match the raw bytes and decode and
+    # lowercase only the short matched groups rather than copying the
+    # whole file through a decode and content.lower() first.
+    # No try/except in here: the per-token body cannot raise on valid
+    # strings, and _count_file already guards each file as a whole.
+    for m in _RE_TOKEN_BYTES.finditer(content):
+        word = m.group(1).decode('utf-8').lower()
+        pos = m.group(2).decode('utf-8').lower()
+        # Handle specific cases and/or/cc, input/output/nn, origin/destination/nn
+        if '/' in word and pos.isalpha() and _RE_TWO_WORDS.fullmatch(word):
+            cleaned_pos = clean_pos_tag(pos)
+            for part in word.split('/'):
+                cleaned_word = clean_word(part)
+                if cleaned_word and cleaned_pos is not None:
+                    pairs_append((cleaned_word, cleaned_pos))
+                    groups_append(tag_to_group_get(cleaned_pos, 'OTHER'))
+            continue
+
+        cleaned_pos = clean_pos_tag(pos)
+        if cleaned_pos is None:
+            continue
+
+        # Most words carry no slash at all; one find here skips the
+        # compound call entirely for them.
+        if '/' not in word or not process_compound_word(word, cleaned_pos, pairs):
+            cleaned_word = clean_word(word)
+            if cleaned_word is not None:
+                pairs_append((cleaned_word, cleaned_pos))
+                groups_append(tag_to_group_get(cleaned_pos, 'OTHER'))
+    pair_counts = Counter(pairs)
+    # Per-tag totals are a projection of the flat pair table; summing the
+    # ~5k unique pairs here beats a third per-token list append.
+    tag_counts: Counter = Counter()
+    for (_, pos), count in pair_counts.items():
+        tag_counts[pos] += count
+    return pair_counts, tag_counts, Counter(groups)
+
+def _count_file(file_path: str, tag_to_group: Dict[str, str]) -> Tuple[Counter, Counter, Counter]:
+    """
+    Reads and counts a single corpus file.
+
+    The file is mapped read-only with mmap so the token scan runs over
+    the OS page cache without a decoded in-memory copy. Returns the
+    file's pair/tag/group Counters; IO errors are logged and yield empty
+    Counters so one bad file cannot abort the run.
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError as e:
+        print(f"Error reading {file_path}: {e}")
+        return Counter(), Counter(), Counter()
+    mm = None
+    try:
+        # mmap cannot map an empty file; there is nothing to count anyway.
+        if os.fstat(fd).st_size == 0:
+            return Counter(), Counter(), Counter()
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        return _count_content(mm, tag_to_group)
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}")
+        return Counter(), Counter(), Counter()
+    finally:
+        if mm is not None:
+            mm.close()
+        os.close(fd)
+
+
+# tag->group mapping for pool workers, installed once per process by
+# _init_worker so each dispatched task carries only a file path instead of
+# pickling analyzer state.
+_WORKER_TAG_TO_GROUP: Dict[str, str] = {}
+
+
+def _init_worker(tag_to_group: Dict[str, str]) -> None:
+    """
+    Pool initializer: stores the tag->group mapping in the worker process.
+    """
+    global _WORKER_TAG_TO_GROUP
+    _WORKER_TAG_TO_GROUP = tag_to_group
+
+
+def _process_file(file_path: str) -> Tuple[Counter, Counter, Counter]:
+    """
+    Pool worker: counts one corpus file with the per-process tag mapping.
+    """
+    return _count_file(file_path, _WORKER_TAG_TO_GROUP)
 
 
 class BrownCorpusAnalyzer:
@@ -13,14 +255,19 @@ class BrownCorpusAnalyzer:
         from detailed POS tags to simplified categories (e.g., mapping 'bed', 'vbz' to 'VERB').
         """
         self.corpus_dir = corpus_dir
-        self.word_pos_counts: DefaultDict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
-        self.pos_total_counts: DefaultDict[str, int] = defaultdict(int)
-        self.grouped_pos_counts: DefaultDict[str, int] = defaultdict(int)
-        self.file_pattern = re.compile(r"^c[a-z]\d{2}$")
-        self.stopwords = [word for word in open(stopwords_file, 'r', encoding='utf-8').read().splitlines() if word]
+        # Flat (word, pos) pair counts accumulated during analysis; pivoted
+        # into the nested word_pos_counts mapping once analysis is done.
+        self._pair_counter: Counter = Counter()
+        self.word_pos_counts: Dict[str, Dict[str, int]] = {}
+        self.pos_total_counts: Counter = Counter()
+        self.grouped_pos_counts: Counter = Counter()
+        # Purely alphabetic words, computed once after analysis and shared by
+        # save_dictionaries and the summary statistics.
+        self._pure_keys: FrozenSet[str] = frozenset()
+        self.stopwords: List[str] = [word for word in open(stopwords_file, 'r', encoding='utf-8').read().splitlines() if word]
         # print(self.stopwords)
 
-        self.pos_groups = {
+        self.pos_groups: Dict[str, List[str]] = {
             'NOUN': ['nn', 'nns', 'np', 'nps', 'nr', 'n$', 'np$', 'nns$', 'nr$', 'nrs'],
             'VERB': ['vb', 'vbd', 'vbg', 'vbn', 'vbz', 'be', 'bed', 'bedz', 'beg', 'bem',
                      'ben', 'ber', 'bez', 'do', 'dod', 'doz', 'hv', 'hvd', 'hvg', 'hvn', 'hvz',
@@ -34,7 +281,7 @@ class BrownCorpusAnalyzer:
             'NUM': ['cd', 'od'],
         }
 
-        self.tag_to_group = {}
+        self.tag_to_group: Dict[str, str] = {}
         for group, tags in self.pos_groups.items():
             for tag in tags:
                 self.tag_to_group[tag] = group
@@ -51,177 +298,55 @@ class BrownCorpusAnalyzer:
             return 'OTHER'
         return self.tag_to_group.get(tag, 'OTHER')
 
-    def clean_pos_tag(self, tag: str) -> str:
-        """
-        Normalizes and cleans a raw POS tag string.
-
-        This handles various tag modifiers found in the corpus:
-        1. Simplifies compound tags (e.g., removing parts after '+').
-        2. Removes prefixes for foreign words ('fw-') or cited words ('nc-', 'np-').
-        3. Strips suffixes related to headlines or titles ('-hl', '-tl').
-        4. Returns 'nil' if the tag is empty or invalid.
-        """
-        if not tag or tag == 'nil':
-            return 'nil'
-        if '*' in tag:
-            return
-        while re.search(r'-(hl|tl|nc)(?:-|$)', tag):
-            tag = re.sub(r'-(hl|tl|nc)(?:-|$)', '', tag)
-        if any(tag.startswith(prefix) for prefix in ['fw-', 'nc-', 'np-']):
-            tag = tag[3:]
-        if '+' in tag:
-            tag = tag.split('+')[0]
-        if '-' in tag:
-            tag = tag.split('-')[0]
-
-        return tag.strip() or 'nil'
-
-    def process_compound_word(self, word: str, pos: str) -> None:
-        """
-        Handles complex word tokens that contain forward slashes.
-
-        If a token contains a slash but is not a simple fraction or date (e.g., 'word1/word2'),
-        this function splits it into component parts and updates the statistics for each part
-        individually. Returns True if the word was processed as a compound.
-        """
-        if '/' in word and not re.match(r'^\d+/\d+$', word):
-            parts = word.split('/')
-            for part in parts:
-                cleaned_word = self.clean_word(part)
-                if cleaned_word and pos is not None:
-                    self.word_pos_counts[cleaned_word][pos] += 1
-                    self.pos_total_counts[pos] += 1
-            return True
-        return False
-
-    def clean_word(self, word: str) -> str:
-        """
-        Sanitizes and normalizes a word string.
-
-        This function performs several cleaning steps:
-        - Strips surrounding quotes and spaces.
-        - Removes possessive endings ("'s").
-        - Filters out tokens that consist solely of punctuation.
-        - Preserves valid hyphenated words (e.g., "1940-50") and fractions.
-        Returns None if the word should be discarded.
-        """
-        word = word.strip('\'" ')
-
-        word = re.sub(r"'s$", "", word)
-
-        # if word in self.stopwords:
-        #     return None
-
-        if word and all(char in string.punctuation for char in word):
-            return None
-
-        if '-' in word:
-            # Keep e.g., 1-2, 1940-50
-            if re.match(r'^\d+(?:-\d+)+$', word):
-                return word
-            if not word.endswith('-'):
-                return word
-        # Keep e.g., 1/2, 3/4
-        if re.match(r'^\d+/\d+$', word):
-            return word
-
-        return word if word else None
-
-    def process_tuple(self, tuple: str) -> None:
-        """
-        Parses and processes a single 'word/tag' tuple from the corpus.
-
-        This function handles the extraction of the word and its tag from the raw string.
-        It accounts for complex cases involving multiple slashes (e.g., 'and/or/cc') and
-        updates the global frequency counters for words, specific POS tags, and grouped POS categories.
-        """
-        if not tuple or '/' not in tuple:
-            return
-        try:
-            # Handle specific cases and/or/cc, input/output/nn, origin/destination/nn
-            if re.match(r'^([a-z]+)/([a-z]+)/([a-z]+)$', tuple):
-                parts = tuple.split('/')
-                pos = parts[-1]
-                word1, word2 = parts[0], parts[1]
-
-                for word in [word1, word2]:
-                    cleaned_word = self.clean_word(word)
-                    cleaned_pos = self.clean_pos_tag(pos)
-                    if cleaned_word and cleaned_pos is not None:
-                        self.word_pos_counts[cleaned_word][cleaned_pos] += 1
-                        self.pos_total_counts[cleaned_pos] += 1
-
-                        pos_group = self.get_pos_group(cleaned_pos)
-                        self.grouped_pos_counts[pos_group] += 1
-                return
-
-            # Handle cases like 1/2/cd
-            elif re.match(r'^\d+(?:/\d+)+/[a-z]+$', tuple):
-                parts = tuple.split('/')
-                word = '/'.join(parts[:-1])
-                pos = parts[-1]
-            else:
-                word, pos = tuple.rsplit('/', 1)
-            if not word or not pos:
-                return
-
-            cleaned_pos = self.clean_pos_tag(pos)
-            if cleaned_pos is None:
-                return
-
-            if not self.process_compound_word(word, cleaned_pos):
-                cleaned_word = self.clean_word(word)
-                if cleaned_word is not None:
-                    self.word_pos_counts[cleaned_word][cleaned_pos] += 1
-                    self.pos_total_counts[cleaned_pos] += 1
-
-                    pos_group = self.get_pos_group(cleaned_pos)
-                    self.grouped_pos_counts[pos_group] += 1
-        except Exception as e:
-            print(f"Error processing tuple '{tuple}': {e}")
-
-    def process_file_content(self, content: str) -> None:
-        """
-        Iterates through the raw content of a file and processes each token.
-
-        Splits the file content by whitespace into individual tuples and delegates
-        the processing of each tuple to the process_tuple method.
-        """
-        content = content.lower()
-        for tuple in re.split(r"\s+", content.strip()):
-            self.process_tuple(tuple)
-
     def read_corpus_file(self, file_path: str) -> None:
         """
         Reads a single file from the corpus directory.
 
-        Opens the file in read mode with UTF-8 encoding and passes its content
-        to be processed. Catches and logs any IO errors encountered.
+        Counts the file and merges its Counters into the analyzer's running
+        totals. IO errors are caught and logged by _count_file.
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                self.process_file_content(content)
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
+        pair_counts, tag_counts, group_counts = _count_file(file_path, self.tag_to_group)
+        self._pair_counter.update(pair_counts)
+        self.pos_total_counts.update(tag_counts)
+        self.grouped_pos_counts.update(group_counts)
 
     def analyze_corpus(self) -> None:
         """
         Orchestrates the analysis of the entire corpus directory.
 
         Iterates through all files in the configured directory that match the
-        expected filename pattern and processes them sequentially.
+        expected filename pattern. Files are independent of each other, so
+        they are counted in a process pool and the per-file Counters merged
+        in submission order, keeping the totals deterministic.
         """
         try:
-            all_files = os.listdir(self.corpus_dir)
+            with os.scandir(self.corpus_dir) as entries:
+                file_paths = [entry.path for entry in entries if _is_corpus_filename(entry.name)]
         except FileNotFoundError:
             print(f"Error: Directory '{self.corpus_dir}' not found")
             return
-        matching_files = [f for f in all_files if self.file_pattern.match(f)]
-        total_files = len(matching_files)
+        total_files = len(file_paths)
         print(f"Processing {total_files} files...")
-        for i, file in enumerate(matching_files, 1):
-            self.read_corpus_file(os.path.join(self.corpus_dir, file))
+        with Pool(initializer=_init_worker, initargs=(self.tag_to_group,)) as pool:
+            for pair_counts, tag_counts, group_counts in pool.imap(
+                    _process_file, file_paths, chunksize=8):
+                self._pair_counter.update(pair_counts)
+                self.pos_total_counts.update(tag_counts)
+                self.grouped_pos_counts.update(group_counts)
+        self._pivot_pair_counts()
+
+    def _pivot_pair_counts(self) -> None:
+        """
+        Rebuilds the nested word_pos_counts mapping from the flat pair counts.
+
+        Called once after analysis so that consumers keep seeing the familiar
+        {word: {pos: count}} shape.
+        """
+        word_pos_counts: Dict[str, Dict[str, int]] = {}
+        for (word, pos), count in self._pair_counter.items():
+            word_pos_counts.setdefault(word, {})[pos] = count
+        self.word_pos_counts = word_pos_counts
+        self._pure_keys = frozenset(word for word in word_pos_counts if word.isalpha())
 
     def save_dictionaries(self) -> None:
         """
@@ -234,30 +359,30 @@ class BrownCorpusAnalyzer:
         - 'pos_grouped_counts.json': Total occurrence count for each simplified POS group.
         """
         try:
-            word_pos_dict = {word: dict(pos_counts) for word, pos_counts in self.word_pos_counts.items()}
-            with open('word_pos_counts.json', 'w', encoding='utf-8') as f:
-                json.dump(word_pos_dict, f, indent=2, sort_keys=True)
+            word_pos_dict = self.word_pos_counts
+            with open('word_pos_counts.json', 'wb') as f:
+                f.write(orjson.dumps(word_pos_dict, option=_ORJSON_OPTS))
             print("Saved complete word-POS counts to word_pos_counts.json")
             words_only_dict = {
-                word: dict(pos_counts)
+                word: pos_counts
                 for word, pos_counts in self.word_pos_counts.items()
-                if word.isalpha()
+                if word in self._pure_keys
             }
-            with open('words_only_counts.json', 'w', encoding='utf-8') as f:
-                json.dump(words_only_dict, f, indent=2, sort_keys=True)
+            with open('words_only_counts.json', 'wb') as f:
+                f.write(orjson.dumps(words_only_dict, option=_ORJSON_OPTS))
             print("Saved words-only counts to words_only_counts.json")
-            with open('pos_total_counts.json', 'w', encoding='utf-8') as f:
-                json.dump(dict(self.pos_total_counts), f, indent=2, sort_keys=True)
+            with open('pos_total_counts.json', 'wb') as f:
+                f.write(orjson.dumps(self.pos_total_counts, option=_ORJSON_OPTS))
             print("Saved POS total counts to pos_total_counts.json")
 
-            with open('pos_grouped_counts.json', 'w', encoding='utf-8') as f:
-                json.dump(dict(self.grouped_pos_counts), f, indent=2, sort_keys=True)
+            with open('pos_grouped_counts.json', 'wb') as f:
+                f.write(orjson.dumps(self.grouped_pos_counts, option=_ORJSON_OPTS))
             print("Saved grouped POS counts to pos_grouped_counts.json")
         except Exception as e:
             print(f"Error saving dictionaries: {e}")
 
 
-def main():
+def main() -> None:
     """
     Main entry point for the script.
 
@@ -270,27 +395,31 @@ def main():
     analyzer.analyze_corpus()
     analyzer.save_dictionaries()
     print("\nCorpus Statistics:")
-    pure_words = {word: counts for word, counts in analyzer.word_pos_counts.items() if word.isalpha()}
-    pure_word_occurrences = sum(sum(pos_counts.values()) for pos_counts in pure_words.values())
+    # The alphabetic key set was computed once during analysis; total the
+    # occurrences in one pass without materializing a filtered dict.
+    pure_keys = analyzer._pure_keys
+    pure_word_occurrences = sum(
+        sum(pos_counts.values())
+        for word, pos_counts in analyzer.word_pos_counts.items()
+        if word in pure_keys
+    )
     print(f"Total number of words (including repetitions):")
-    print(f"  - All tuples: {sum(analyzer.pos_total_counts.values()):,d}")
+    print(f"  - All tuples: {analyzer.pos_total_counts.total():,d}")
     print(f"  - Pure words only: {pure_word_occurrences:,d}")
     print(f"\nTotal number of distinct words:")
     print(f"  - All tuples: {len(analyzer.word_pos_counts):,d}")
-    print(f"  - Pure words only: {len(pure_words):,d}")
+    print(f"  - Pure words only: {len(pure_keys):,d}")
     print(f"\nTotal number of distinct parts of speech: {len(analyzer.pos_total_counts)}")
     print(f"\nNumber of Parts of Speech: {len(analyzer.pos_total_counts)}")
     print("\nOccurrences for each Part of Speech:")
-    sorted_pos = sorted(analyzer.pos_total_counts.items(), key=lambda x: x[1], reverse=True)
-    for pos, count in sorted_pos:
+    for pos, count in analyzer.pos_total_counts.most_common():
         print(f"{pos}: {count:,d}")
 
     print("\n" + "=" * 50)
     print("\nGrouped POS Statistics:")
     print(f"Number of POS Groups: {len(analyzer.grouped_pos_counts)}")
     print("\nOccurrences for each POS Group:")
-    sorted_groups = sorted(analyzer.grouped_pos_counts.items(), key=lambda x: x[1], reverse=True)
-    for group, count in sorted_groups:
+    for group, count in analyzer.grouped_pos_counts.most_common():
         print(f"{group}: {count:,d}")
 
 